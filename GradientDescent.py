@@ -12,7 +12,7 @@ Methods:
     - gradient_descent(func, start_point, learning_rate=0.01, max_iter=500, 
     tolerance=1e-6, h=1e-5): Executes the gradient descent algorithm.
 """
-from typing import Callable, Tuple, List
+from typing import Callable, Tuple, List, Optional
 import numpy as np
 
 
@@ -60,7 +60,9 @@ def gradient_descent(
     learning_rate: float = 0.005,
     max_iter: int = 100,
     tolerance: float = 1e-7,
-    h: float = 0.0001
+    h: float = 0.0001,
+    callback: Optional[Callable[[int, float], None]] = None,
+    verbose: bool = True
 ) -> Tuple[List[float], float, List[Tuple[float, float, float]]]:
     """
     Ejecuta descenso por gradiente numérico sobre una función objetivo.
@@ -78,6 +80,12 @@ def gradient_descent(
             Umbral para detener cuando ||grad|| es pequeño. Por defecto 1e-6.
         h (float, opcional): 
             Paso para diferencia finita. Por defecto 1e-5.
+        callback (Callable[[int, float], None], opcional):
+            Función que se invoca en cada iteración con el índice y el valor
+            de la función. Por defecto None.
+        verbose (bool, opcional):
+            Si es True, imprime el progreso cada 50 iteraciones y el aviso
+            de parada. Por defecto True.
 
     Returns:
         Tuple[List[float], float, List[Tuple[float, float, float]]]:
@@ -100,14 +108,19 @@ def gradient_descent(
         f_val = func(current_point)
         history.append((current_point[0], current_point[1], f_val))
 
+        # Notificar progreso
+        if callback is not None:
+            callback(i, f_val)
+
         # Mostrar progreso cada 50 iteraciones
-        if i % 50 == 0:
+        if verbose and i % 50 == 0:
             print(f"Iteración {i}: f({current_point}) = {f_val:.6f}, "
                   f"||grad|| = {grad_norm:.6e}")
 
         # Verificar condición de parada por gradiente pequeño
         if grad_norm < tolerance:
-            print("Gradiente suficientemente pequeño. Deteniendo.")
+            if verbose:
+                print("Gradiente suficientemente pequeño. Deteniendo.")
             break
 
         # Actualizar posición
@@ -0,0 +1,549 @@
+"""
+Module for a local optimization job service.
+
+This module exposes `tabu_search` and `gradient_descent` through a small
+HTTP server on localhost built with `asyncio` from the standard library.
+Jobs run on a persistent pool of warm worker processes, so callers do not
+pay interpreter startup and imports on every run, and results are cached
+by (method, params, seed) so that repeated identical requests return
+immediately. Progress reported by the iteration loops is streamed back to
+the client while the job runs.
+
+Protocol:
+    POST /jobs with a JSON body {"method": ..., "params": {...}, "seed": ...}
+    answers with newline-delimited JSON events:
+        {"event": "progress", "iteration": i, "value": v}
+        {"event": "result", "cached": bool, "result": {...}}
+        {"event": "error", "message": "..."}
+    GET /health answers with {"status": "ok", "cached": <entries>,
+    "max_cache": <limit>}.
+
+The seed must be an integer. Jobs without a seed are only cached for
+deterministic methods. The cache keeps at most `max_cache` results and
+evicts the least recently used one first.
+
+Classes:
+    - OptimizationService: Asyncio server with worker pool and result cache.
+
+Methods:
+    - submit_job(method, params, seed, ...): Client that sends a job and
+        returns its result, forwarding progress events to a callback.
+    - serve(host, port, max_workers, max_cache): Runs the service until
+        interrupted.
+"""
+import asyncio
+import http.client
+import inspect
+import json
+import multiprocessing as mp
+import os
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+import GradientDescent as gd
+import TabuLangermann as tl
+
+
+
+# Dirección por defecto del servicio
+DEFAULT_HOST: str = "127.0.0.1"
+DEFAULT_PORT: int = 8765
+
+# Número máximo de resultados en caché por defecto
+DEFAULT_MAX_CACHE: int = 1024
+
+# Métodos disponibles y si son deterministas (cacheables sin semilla)
+METHODS: Dict[str, bool] = {
+    "tabu_search": False,
+    "gradient_descent": True
+}
+
+# Cola de progreso del proceso trabajador (asignada por el inicializador)
+_progress_queue = None
+
+
+def _init_worker(queue) -> None:
+    """
+    Inicializa un proceso trabajador del pool.
+
+    Args:
+        queue: Cola compartida donde se publican eventos de progreso.
+    """
+    global _progress_queue
+    _progress_queue = queue
+
+
+def _warm_up() -> None:
+    """
+    Tarea vacía que obliga al pool a crear sus procesos de antemano.
+    """
+
+
+def _run_job(job_id: int,
+             method: str,
+             params: Dict[str, Any],
+             seed: Optional[int],
+             progress_every: int) -> Dict[str, Any]:
+    """
+    Ejecuta un trabajo de optimización dentro de un proceso trabajador.
+
+    Args:
+        job_id (int): Identificador del trabajo para etiquetar el progreso.
+        method (str): 'tabu_search' o 'gradient_descent'.
+        params (Dict[str, Any]): Argumentos del método.
+        seed (Optional[int]): Semilla del generador aleatorio.
+        progress_every (int): Cada cuántas iteraciones publicar progreso.
+
+    Returns:
+        Dict[str, Any]: Resultado con las claves 'best', 'best_value' e
+            'history' (más las propias del método).
+    """
+    def report(iteration: int, value: float) -> None:
+        if progress_every and iteration % progress_every == 0:
+            _progress_queue.put((job_id, iteration, float(value)))
+
+    random.seed(seed)
+
+    try:
+        if method == "tabu_search":
+            return tl.tabu_search(callback=report, **params)
+
+        punto, valor, historial = gd.gradient_descent(
+            func=tl.evaluate_langermann, callback=report, verbose=False,
+            **params)
+        return {
+            "best": punto,
+            "best_value": valor,
+            "history": [list(map(float, h)) for h in historial]
+        }
+    finally:
+        # Señal de fin de progreso para este trabajo
+        _progress_queue.put((job_id, None, None))
+
+
+def _cache_key(method: str,
+               params: Dict[str, Any],
+               seed: Optional[int]) -> str:
+    """
+    Construye la clave canónica de caché de un trabajo.
+
+    Los parámetros se enlazan a la firma del método y se completan con sus
+    valores por defecto, de modo que omitir un argumento o pasarlo con su
+    valor por defecto produce la misma clave.
+
+    Args:
+        method (str): Nombre del método.
+        params (Dict[str, Any]): Argumentos del método.
+        seed (Optional[int]): Semilla del generador aleatorio.
+
+    Returns:
+        str: Clave JSON con las claves ordenadas.
+
+    Raises:
+        TypeError: Si los parámetros no corresponden a la firma del método
+            o incluyen argumentos que fija el servicio.
+    """
+    # Argumentos que fija el servicio y no puede enviar el cliente
+    fixed = {"callback": None}
+    if method == "tabu_search":
+        function = tl.tabu_search
+    else:
+        function = gd.gradient_descent
+        fixed["func"] = None
+        fixed["verbose"] = False
+
+    reserved = fixed.keys() & params.keys()
+    if reserved:
+        raise TypeError(f"Parámetros no permitidos: {sorted(reserved)}")
+
+    bound = inspect.signature(function).bind(**fixed, **params)
+    bound.apply_defaults()
+    arguments = {name: value for name, value in bound.arguments.items()
+                 if name not in fixed}
+
+    return json.dumps([method, arguments, seed], sort_keys=True)
+
+
+class OptimizationService:
+    """
+    Servidor asyncio de trabajos de optimización con pool y caché.
+
+    Attributes:
+        host (str): Dirección en la que escucha el servidor.
+        port (int): Puerto en el que escucha. Con 0 se asigna uno libre,
+            disponible tras `start()`.
+        max_workers (Optional[int]): Número de procesos del pool.
+        progress_every (int): Cada cuántas iteraciones reportar progreso.
+        max_cache (int): Número máximo de resultados en caché.
+        cache (OrderedDict[str, Dict[str, Any]]): Resultados ya calculados,
+            del menos al más recientemente usado.
+    """
+
+    def __init__(self,
+                 host: str = DEFAULT_HOST,
+                 port: int = DEFAULT_PORT,
+                 max_workers: Optional[int] = None,
+                 progress_every: int = 10,
+                 max_cache: int = DEFAULT_MAX_CACHE) -> None:
+        """
+        Configura el servicio sin iniciarlo.
+
+        Args:
+            host (str): Dirección en la que escuchar.
+            port (int): Puerto en el que escuchar (0 para uno libre).
+            max_workers (Optional[int]): Número de procesos del pool.
+            progress_every (int): Cada cuántas iteraciones reportar progreso.
+            max_cache (int): Número máximo de resultados en caché.
+        """
+        self.host = host
+        self.port = port
+        self.max_workers = max_workers
+        self.progress_every = progress_every
+        self.max_cache = max_cache
+        self.cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._listeners: Dict[int, asyncio.Queue] = {}
+        self._next_job = 0
+        self._server = None
+        self._executor = None
+        self._queue = None
+        self._dispatcher = None
+        self._loop = None
+
+    async def start(self) -> None:
+        """
+        Inicia el pool de procesos, el despachador de progreso y el servidor.
+        """
+        self._loop = asyncio.get_running_loop()
+
+        # Crear el pool de trabajadores con la cola de progreso compartida
+        context = mp.get_context()
+        self._queue = context.Queue()
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers,
+                                             mp_context=context,
+                                             initializer=_init_worker,
+                                             initargs=(self._queue,))
+
+        # Hilo que reenvía el progreso de los procesos al bucle de eventos
+        self._dispatcher = threading.Thread(target=self._dispatch,
+                                            daemon=True)
+        self._dispatcher.start()
+
+        # Calentar el pool: crear todos los procesos antes del primer trabajo
+        await asyncio.gather(*(
+            self._loop.run_in_executor(self._executor, _warm_up)
+            for _ in range(self.max_workers or os.cpu_count() or 1)))
+
+        self._server = await asyncio.start_server(self._handle,
+                                                  self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+
+    async def close(self) -> None:
+        """
+        Detiene el servidor, el despachador y el pool de procesos.
+        """
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+        if self._queue is not None:
+            self._queue.put(None)
+            self._dispatcher.join()
+            self._queue.close()
+
+    async def serve_forever(self) -> None:
+        """
+        Inicia el servicio y atiende peticiones hasta ser cancelado.
+        """
+        await self.start()
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    def _dispatch(self) -> None:
+        """
+        Lee la cola de progreso y entrega cada evento a su trabajo.
+        """
+        while True:
+            message = self._queue.get()
+            if message is None:
+                break
+            job_id, iteration, value = message
+            self._loop.call_soon_threadsafe(self._deliver, job_id,
+                                            iteration, value)
+
+    def _deliver(self, job_id: int, iteration: Optional[int],
+                 value: Optional[float]) -> None:
+        """
+        Entrega un evento de progreso a la cola del trabajo, si sigue activo.
+        """
+        listener = self._listeners.get(job_id)
+        if listener is not None:
+            listener.put_nowait(None if iteration is None
+                                else (iteration, value))
+
+    async def run_job(self,
+                      method: str,
+                      params: Dict[str, Any],
+                      seed: Optional[int] = None,
+                      on_progress: Optional[Callable[[int, float], Any]]
+                      = None) -> Tuple[Dict[str, Any], bool]:
+        """
+        Ejecuta un trabajo en el pool o lo resuelve desde la caché.
+
+        Args:
+            method (str): 'tabu_search' o 'gradient_descent'.
+            params (Dict[str, Any]): Argumentos del método.
+            seed (Optional[int]): Semilla del generador aleatorio.
+            on_progress (Optional[Callable[[int, float], Any]]): Corrutina o
+                función invocada con (iteración, valor) durante la corrida.
+
+        Returns:
+            Tuple[Dict[str, Any], bool]:
+                - Resultado del trabajo.
+                - True si provino de la caché o de un trabajo idéntico en
+                  curso.
+        """
+        if method not in METHODS:
+            raise ValueError(f"Método desconocido: {method}")
+
+        cacheable = seed is not None or METHODS[method]
+        key = _cache_key(method, params, seed)
+
+        # Responder desde la caché o esperar un trabajo idéntico en curso
+        if cacheable and key in self.cache:
+            self.cache.move_to_end(key)
+            return self.cache[key], True
+        if cacheable and key in self._pending:
+            return await asyncio.shield(self._pending[key]), True
+
+        job_id = self._next_job
+        self._next_job += 1
+        listener = asyncio.Queue()
+        self._listeners[job_id] = listener
+
+        future = asyncio.wrap_future(self._executor.submit(
+            _run_job, job_id, method, params, seed, self.progress_every))
+        if cacheable:
+            # Guardar el resultado al terminar el trabajo, aunque el cliente
+            # que lo pidió se haya desconectado
+            self._pending[key] = future
+            future.add_done_callback(
+                lambda done: self._store_result(key, done))
+
+        # Si el proceso muere sin enviar la señal de fin, cerrar el flujo
+        def close_on_failure(done: asyncio.Future) -> None:
+            if not done.cancelled() and done.exception() is not None:
+                listener.put_nowait(None)
+
+        future.add_done_callback(close_on_failure)
+
+        try:
+            # Reenviar progreso hasta la señal de fin
+            while True:
+                event = await listener.get()
+                if event is None:
+                    break
+                if on_progress is not None:
+                    reply = on_progress(*event)
+                    if asyncio.iscoroutine(reply):
+                        await reply
+
+            result = await future
+        finally:
+            del self._listeners[job_id]
+
+        return result, False
+
+    def _store_result(self, key: str, future: asyncio.Future) -> None:
+        """
+        Libera un trabajo en curso y guarda su resultado en la caché,
+        expulsando el usado hace más tiempo si se excede `max_cache`.
+        """
+        self._pending.pop(key, None)
+        if future.cancelled() or future.exception() is not None:
+            return
+
+        if self.max_cache > 0:
+            self.cache[key] = future.result()
+            self.cache.move_to_end(key)
+            while len(self.cache) > self.max_cache:
+                self.cache.popitem(last=False)
+
+    async def _handle(self, reader: asyncio.StreamReader,
+                      writer: asyncio.StreamWriter) -> None:
+        """
+        Atiende una conexión HTTP.
+        """
+        try:
+            try:
+                # Leer línea de petición, cabeceras y cuerpo
+                request_line = (await reader.readline()).decode().split()
+                headers = {}
+                while True:
+                    line = (await reader.readline()).decode().strip()
+                    if not line:
+                        break
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length < 0:
+                    raise ValueError(length)
+                body = await reader.readexactly(length) if length else b""
+            except (ValueError, UnicodeDecodeError):
+                await self._respond(writer, 400,
+                                    {"error": "Petición inválida"})
+                return
+
+            if len(request_line) < 2:
+                await self._respond(writer, 400, {"error": "Petición inválida"})
+            elif request_line[:2] == ["GET", "/health"]:
+                await self._respond(writer, 200, {"status": "ok",
+                                                  "cached": len(self.cache),
+                                                  "max_cache": self.max_cache})
+            elif request_line[:2] == ["POST", "/jobs"]:
+                await self._handle_job(writer, body)
+            else:
+                await self._respond(writer, 404, {"error": "No encontrado"})
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _handle_job(self, writer: asyncio.StreamWriter,
+                          body: bytes) -> None:
+        """
+        Valida un trabajo y transmite su progreso y resultado como NDJSON.
+        """
+        try:
+            job = json.loads(body or b"{}")
+            method = job["method"]
+            params = job.get("params", {})
+            seed = job.get("seed")
+            if method not in METHODS or not isinstance(params, dict):
+                raise ValueError(method)
+            if seed is not None and (not isinstance(seed, int)
+                                     or isinstance(seed, bool)):
+                raise TypeError(seed)
+        except (ValueError, KeyError, TypeError):
+            await self._respond(writer, 400, {"error": "Trabajo inválido"})
+            return
+
+        writer.write(b"HTTP/1.1 200 OK\r\n"
+                     b"Content-Type: application/x-ndjson\r\n"
+                     b"Connection: close\r\n\r\n")
+
+        async def send(event: Dict[str, Any]) -> None:
+            writer.write(json.dumps(event).encode() + b"\n")
+            await writer.drain()
+
+        async def progress(iteration: int, value: float) -> None:
+            await send({"event": "progress", "iteration": iteration,
+                        "value": value})
+
+        try:
+            result, cached = await self.run_job(method, params, seed,
+                                                progress)
+            await send({"event": "result", "cached": cached,
+                        "result": result})
+        except (ConnectionError, asyncio.CancelledError):
+            raise
+        except Exception as error:
+            await send({"event": "error", "message": repr(error)})
+
+    async def _respond(self, writer: asyncio.StreamWriter, status: int,
+                       payload: Dict[str, Any]) -> None:
+        """
+        Envía una respuesta JSON completa.
+        """
+        body = json.dumps(payload).encode()
+        reason = http.client.responses.get(status, "")
+        writer.write(f"HTTP/1.1 {status} {reason}\r\n"
+                     f"Content-Type: application/json\r\n"
+                     f"Content-Length: {len(body)}\r\n"
+                     f"Connection: close\r\n\r\n".encode() + body)
+        await writer.drain()
+
+
+def submit_job(method: str,
+               params: Optional[Dict[str, Any]] = None,
+               seed: Optional[int] = None,
+               host: str = DEFAULT_HOST,
+               port: int = DEFAULT_PORT,
+               on_progress: Optional[Callable[[int, float], None]] = None,
+               timeout: Optional[float] = None) -> Dict[str, Any]:
+    """
+    Envía un trabajo al servicio y espera su resultado.
+
+    Args:
+        method (str): 'tabu_search' o 'gradient_descent'.
+        params (Optional[Dict[str, Any]]): Argumentos del método. Para
+            'gradient_descent' debe incluir 'start_point'.
+        seed (Optional[int]): Semilla del generador aleatorio.
+        host (str): Dirección del servicio.
+        port (int): Puerto del servicio.
+        on_progress (Optional[Callable[[int, float], None]]): Función
+            invocada con (iteración, valor) por cada evento de progreso.
+        timeout (Optional[float]): Tiempo máximo de espera del socket.
+
+    Returns:
+        Dict[str, Any]: Resultado del trabajo, con la clave adicional
+            'cached' que indica si provino de la caché.
+    """
+    connection = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        connection.request("POST", "/jobs",
+                           json.dumps({"method": method,
+                                       "params": params or {},
+                                       "seed": seed}),
+                           {"Content-Type": "application/json"})
+        response = connection.getresponse()
+        if response.status != 200:
+            raise RuntimeError(json.loads(response.read())["error"])
+
+        # Procesar eventos hasta recibir el resultado
+        for line in response:
+            event = json.loads(line)
+            if event["event"] == "progress":
+                if on_progress is not None:
+                    on_progress(event["iteration"], event["value"])
+            elif event["event"] == "result":
+                return dict(event["result"], cached=event["cached"])
+            else:
+                raise RuntimeError(event["message"])
+
+        raise RuntimeError("Conexión cerrada sin resultado")
+    finally:
+        connection.close()
+
+
+def serve(host: str = DEFAULT_HOST,
+          port: int = DEFAULT_PORT,
+          max_workers: Optional[int] = None,
+          max_cache: int = DEFAULT_MAX_CACHE) -> None:
+    """
+    Ejecuta el servicio hasta que se interrumpa (Ctrl+C).
+
+    Args:
+        host (str): Dirección en la que escuchar.
+        port (int): Puerto en el que escuchar.
+        max_workers (Optional[int]): Número de procesos del pool.
+        max_cache (int): Número máximo de resultados en caché.
+    """
+    service = OptimizationService(host, port, max_workers,
+                                  max_cache=max_cache)
+    print(f"Servicio de optimización en http://{host}:{port}")
+    try:
+        asyncio.run(service.serve_forever())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    serve()
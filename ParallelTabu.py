@@ -0,0 +1,445 @@
+"""
+Module for cooperative parallel Tabu search on the Langermann function.
+
+This module runs several worker processes, each executing the `tabu_search`
+loop of `TabuLangermann` in short epochs. After every epoch the workers
+publish their elite solutions and their most recent tabu entries in a
+shared-memory block (`multiprocessing.shared_memory`), read what the other
+workers published, and continue. A worker that did not improve during an
+epoch restarts from one of the best shared elites.
+
+Shared memory layout (float64, one slot per worker):
+    - `elite_size` rows of (x, y, value). Empty rows hold value = inf.
+    - `shared_tabu` rows of (x, y). Empty rows hold NaN.
+
+Each worker only writes its own slot, so the lock only keeps readers from
+observing a slot while it is half-written.
+
+Methods:
+    - parallel_tabu_search(...): Executes the cooperative search and returns
+        a result dictionary compatible with `tabu_search`.
+"""
+import math
+import multiprocessing as mp
+import os
+import queue
+import random
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Tuple
+
+import TabuLangermann as tl
+
+
+
+# Número de flotantes por fila de élite (x, y, valor) y por fila tabú (x, y)
+ELITE_FIELDS: int = 3
+TABU_FIELDS: int = 2
+
+
+def _slot_size(elite_size: int, shared_tabu: int) -> int:
+    """
+    Calcula la cantidad de flotantes que ocupa el bloque de un trabajador.
+
+    Args:
+        elite_size (int): Número de soluciones élite por trabajador.
+        shared_tabu (int): Número de entradas tabú compartidas por trabajador.
+
+    Returns:
+        int: Cantidad de flotantes del bloque.
+    """
+    return elite_size * ELITE_FIELDS + shared_tabu * TABU_FIELDS
+
+
+def _write_slot(buffer: memoryview,
+                worker_id: int,
+                elites: List[Tuple[float, float, float]],
+                tabu_entries: List[List[float]],
+                elite_size: int,
+                shared_tabu: int) -> None:
+    """
+    Escribe las élites y entradas tabú de un trabajador en memoria compartida.
+
+    Args:
+        buffer (memoryview): Vista de flotantes sobre la memoria compartida.
+        worker_id (int): Índice del trabajador dueño del bloque.
+        elites (List[Tuple[float, float, float]]): Élites (x, y, valor)
+            ordenadas de mejor a peor.
+        tabu_entries (List[List[float]]): Entradas tabú más recientes.
+        elite_size (int): Número de filas de élite del bloque.
+        shared_tabu (int): Número de filas tabú del bloque.
+    """
+    offset = worker_id * _slot_size(elite_size, shared_tabu)
+
+    # Escribir élites, rellenando filas vacías con valor infinito
+    for i in range(elite_size):
+        row = elites[i] if i < len(elites) else (math.nan, math.nan, math.inf)
+        for j in range(ELITE_FIELDS):
+            buffer[offset + i * ELITE_FIELDS + j] = row[j]
+    offset += elite_size * ELITE_FIELDS
+
+    # Escribir entradas tabú, rellenando filas vacías con NaN
+    recent = tabu_entries[-shared_tabu:] if shared_tabu else []
+    for i in range(shared_tabu):
+        row = recent[i] if i < len(recent) else (math.nan, math.nan)
+        for j in range(TABU_FIELDS):
+            buffer[offset + i * TABU_FIELDS + j] = row[j]
+
+
+def _read_shared(buffer: memoryview,
+                 num_workers: int,
+                 elite_size: int,
+                 shared_tabu: int,
+                 exclude: Optional[int] = None
+                 ) -> Tuple[List[Tuple[float, float, float]],
+                            List[List[List[float]]]]:
+    """
+    Lee todas las élites y entradas tabú publicadas por los trabajadores.
+
+    Args:
+        buffer (memoryview): Vista de flotantes sobre la memoria compartida.
+        num_workers (int): Número de trabajadores.
+        elite_size (int): Número de filas de élite por bloque.
+        shared_tabu (int): Número de filas tabú por bloque.
+        exclude (Optional[int]): Trabajador cuyas entradas tabú se omiten
+            (normalmente el que lee, que ya las tiene en su propia lista).
+
+    Returns:
+        Tuple[List[Tuple[float, float, float]], List[List[List[float]]]]:
+            - Élites (x, y, valor) de todos los bloques, ordenadas por valor.
+            - Entradas tabú [x, y] de cada bloque, de la más antigua a la
+              más reciente (lista vacía para el bloque excluido).
+    """
+    elites = []
+    tabu_entries = [[] for _ in range(num_workers)]
+    size = _slot_size(elite_size, shared_tabu)
+
+    for worker_id in range(num_workers):
+        offset = worker_id * size
+
+        # Leer élites, ignorando filas vacías
+        for i in range(elite_size):
+            base = offset + i * ELITE_FIELDS
+            x, y, value = buffer[base], buffer[base + 1], buffer[base + 2]
+            if value != math.inf:
+                elites.append((x, y, value))
+        offset += elite_size * ELITE_FIELDS
+
+        if worker_id == exclude:
+            continue
+
+        # Leer entradas tabú, ignorando filas vacías
+        for i in range(shared_tabu):
+            base = offset + i * TABU_FIELDS
+            x, y = buffer[base], buffer[base + 1]
+            if not math.isnan(x):
+                tabu_entries[worker_id].append([x, y])
+
+    elites.sort(key=lambda e: e[2])
+    return elites, tabu_entries
+
+
+def _round_robin(groups: List[List[List[float]]],
+                 limit: int,
+                 start: int = 0) -> List[List[float]]:
+    """
+    Toma hasta `limit` entradas alternando entre grupos, de la más reciente
+    a la más antigua de cada uno, para que ningún grupo acapare el cupo.
+
+    Args:
+        groups (List[List[List[float]]]): Entradas de cada trabajador,
+            de la más antigua a la más reciente.
+        limit (int): Número máximo de entradas a tomar.
+        start (int): Grupo por el que empieza el recorrido.
+
+    Returns:
+        List[List[float]]: Entradas seleccionadas.
+    """
+    # Rotar los grupos y ordenar cada uno de la más reciente a la más antigua
+    ordered = [g[::-1] for g in groups[start:] + groups[:start]]
+
+    picked = []
+    depth = 0
+    while len(picked) < limit and any(depth < len(g) for g in ordered):
+        for group in ordered:
+            if depth < len(group) and len(picked) < limit:
+                picked.append(group[depth])
+        depth += 1
+
+    return picked
+
+
+def _merge_elites(elites: List[Tuple[float, float, float]],
+                  candidate: Tuple[float, float, float],
+                  elite_size: int,
+                  tolerance: float = 0.01) -> List[Tuple[float, float, float]]:
+    """
+    Inserta una solución en la lista de élites evitando duplicados cercanos.
+
+    Args:
+        elites (List[Tuple[float, float, float]]): Élites actuales.
+        candidate (Tuple[float, float, float]): Solución (x, y, valor).
+        elite_size (int): Número máximo de élites a conservar.
+        tolerance (float): Distancia bajo la cual dos soluciones se
+            consideran la misma.
+
+    Returns:
+        List[Tuple[float, float, float]]: Élites ordenadas de mejor a peor.
+    """
+    for i, (x, y, value) in enumerate(elites):
+        if math.hypot(candidate[0] - x, candidate[1] - y) < tolerance:
+            # Conservar la mejor de las dos versiones de la misma solución
+            if candidate[2] < value:
+                elites[i] = candidate
+            break
+    else:
+        elites.append(candidate)
+
+    elites.sort(key=lambda e: e[2])
+    return elites[:elite_size]
+
+
+def _worker(worker_id: int,
+            shm_name: str,
+            lock,
+            results,
+            num_workers: int,
+            num_epochs: int,
+            epoch_iterations: int,
+            num_neighbors: int,
+            tabu_size: int,
+            sigma: float,
+            elite_size: int,
+            shared_tabu: int,
+            seed: Optional[int]) -> None:
+    """
+    Ejecuta las épocas de búsqueda tabú de un trabajador cooperativo.
+
+    Args:
+        worker_id (int): Índice del trabajador.
+        shm_name (str): Nombre del bloque de memoria compartida.
+        lock: Candado que protege lecturas y escrituras del bloque.
+        results: Cola donde se publica el resultado final del trabajador.
+        num_workers (int): Número total de trabajadores.
+        num_epochs (int): Número de épocas de búsqueda.
+        epoch_iterations (int): Iteraciones de `tabu_search` por época.
+        num_neighbors (int): Cantidad de vecinos generados por iteración.
+        tabu_size (int): Tamaño máximo de la lista tabú.
+        sigma (float): Desviación estándar del ruido gaussiano para vecinos.
+        elite_size (int): Número de élites publicadas por trabajador.
+        shared_tabu (int): Número de entradas tabú publicadas por trabajador.
+        seed (Optional[int]): Semilla base; cada trabajador usa seed + id.
+    """
+    # Sembrar el generador de forma distinta en cada proceso
+    random.seed(None if seed is None else seed + worker_id)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    buffer = shm.buf.cast("d")
+
+    try:
+        start_point = None
+        tabu_list = []
+        elites = []
+        best = None
+        best_value = float("inf")
+        history = []
+        initial_point = None
+        restarts = 0
+
+        for epoch in range(num_epochs):
+            # Ejecutar una época del bucle de búsqueda tabú
+            result = tl.tabu_search(num_iterations=epoch_iterations,
+                                    num_neighbors=num_neighbors,
+                                    tabu_size=tabu_size,
+                                    sigma=sigma,
+                                    start_point=start_point,
+                                    initial_tabu=tabu_list)
+
+            if initial_point is None:
+                initial_point = result["initial_point"]
+
+            # Acumular historial (el primer valor repite el punto inicial)
+            epoch_history = result["history"] if epoch == 0 \
+                else result["history"][1:]
+            history.extend(min(v, best_value) for v in epoch_history)
+
+            # Detectar estancamiento: la época no mejoró el mejor propio
+            improved = result["best_value"] < best_value
+            if improved:
+                best = result["best"]
+                best_value = result["best_value"]
+
+            elites = _merge_elites(
+                elites, (best[0], best[1], best_value), elite_size)
+
+            # Publicar élites propias y leer las de todos los trabajadores
+            with lock:
+                _write_slot(buffer, worker_id, elites, result["tabu_list"],
+                            elite_size, shared_tabu)
+                shared_elites, shared_entries = _read_shared(
+                    buffer, num_workers, elite_size, shared_tabu,
+                    exclude=worker_id)
+
+            # Adoptar en la lista tabú entradas de los demás trabajadores,
+            # tomadas por turnos y limitadas a la mitad de la lista, de modo
+            # que siempre quede sitio para los movimientos propios recientes.
+            # Se agregan al final porque `tabu_search` solo conserva las
+            # `tabu_size - 1` entradas más recientes.
+            others = _round_robin(shared_entries, tabu_size // 2,
+                                  start=(worker_id + 1) % num_workers)
+            own = result["tabu_list"]
+            keep = tabu_size - 1 - len(others)
+            tabu_list = (own[max(0, len(own) - keep):] if keep > 0 else []) \
+                + others
+
+            if improved or not shared_elites:
+                # Continuar la trayectoria desde donde quedó
+                start_point = result["last_point"]
+            else:
+                # Reiniciar desde una de las mejores élites compartidas
+                x, y, _ = random.choice(shared_elites[:elite_size])
+                start_point = [x, y]
+                restarts += 1
+
+        results.put({
+            "worker_id": worker_id,
+            "best": best,
+            "best_value": best_value,
+            "history": history,
+            "initial_point": initial_point,
+            "restarts": restarts
+        })
+    except Exception as error:
+        # Avisar al proceso principal en lugar de dejarlo esperando
+        results.put({"worker_id": worker_id, "error": repr(error)})
+        raise
+    finally:
+        # Liberar la vista antes de cerrar el bloque compartido
+        buffer.release()
+        shm.close()
+
+
+def parallel_tabu_search(num_workers: Optional[int] = None,
+                         num_epochs: int = 20,
+                         epoch_iterations: int = 50,
+                         num_neighbors: int = 50,
+                         tabu_size: int = 30,
+                         sigma: float = 0.8,
+                         elite_size: int = 5,
+                         shared_tabu: int = 10,
+                         seed: Optional[int] = None
+                         ) -> Dict[str, Any]:
+    """
+    Ejecuta Búsqueda Tabú cooperativa en varios procesos con memoria élite
+    compartida.
+
+    Cada trabajador realiza `num_epochs * epoch_iterations` iteraciones, es
+    decir, el mismo trabajo que una corrida aislada de `tabu_search` con
+    `num_iterations = num_epochs * epoch_iterations`.
+
+    Args:
+        num_workers (Optional[int]): Número de procesos. Por defecto, el
+            número de núcleos disponibles.
+        num_epochs (int): Número de intercambios entre trabajadores.
+        epoch_iterations (int): Iteraciones de `tabu_search` por época.
+        num_neighbors (int): Cantidad de vecinos generados por iteración.
+        tabu_size (int): Tamaño máximo de la lista tabú.
+        sigma (float): Desviación estándar del ruido gaussiano para vecinos.
+        elite_size (int): Número de élites publicadas por trabajador.
+        shared_tabu (int): Número de entradas tabú publicadas por trabajador.
+        seed (Optional[int]): Semilla base para reproducibilidad.
+
+    Returns:
+        Dict[str, Any]:
+            Diccionario con:
+            - 'best': Mejor solución [x, y] encontrada por cualquier proceso.
+            - 'best_value': Valor mínimo encontrado.
+            - 'history': Historial del trabajador que encontró el mínimo.
+            - 'initial_point': Punto inicial de ese trabajador.
+            - 'workers': Resultados individuales de cada trabajador.
+
+    Raises:
+        ValueError: Si `num_workers` o `num_epochs` son menores que 1.
+        RuntimeError: Si algún trabajador falla.
+    """
+    if num_workers is None:
+        num_workers = os.cpu_count() or 1
+    if num_workers < 1:
+        raise ValueError("num_workers debe ser al menos 1.")
+    if num_epochs < 1:
+        raise ValueError("num_epochs debe ser al menos 1.")
+
+    # Reservar un bloque de flotantes de 8 bytes por trabajador
+    size = num_workers * _slot_size(elite_size, shared_tabu)
+    shm = shared_memory.SharedMemory(create=True, size=max(size, 1) * 8)
+    buffer = shm.buf.cast("d")
+
+    processes = []
+    try:
+        # Inicializar todos los bloques como vacíos
+        for worker_id in range(num_workers):
+            _write_slot(buffer, worker_id, [], [], elite_size, shared_tabu)
+
+        lock = mp.Lock()
+        results = mp.Queue()
+        processes = [
+            mp.Process(target=_worker,
+                       args=(worker_id, shm.name, lock, results, num_workers,
+                             num_epochs, epoch_iterations, num_neighbors,
+                             tabu_size, sigma, elite_size, shared_tabu, seed))
+            for worker_id in range(num_workers)
+        ]
+        for process in processes:
+            process.start()
+
+        # Recoger resultados antes de esperar a los procesos, vigilando que
+        # ningún trabajador haya muerto sin publicar su resultado
+        workers = []
+        while len(workers) < len(processes):
+            try:
+                record = results.get(timeout=1.0)
+            except queue.Empty:
+                dead = [p.exitcode for p in processes
+                        if p.exitcode not in (None, 0)]
+                if dead:
+                    raise RuntimeError(
+                        f"Un trabajador terminó con código {dead[0]}.")
+                continue
+
+            if "error" in record:
+                raise RuntimeError(f"El trabajador {record['worker_id']} "
+                                   f"falló: {record['error']}")
+            workers.append(record)
+
+        for process in processes:
+            process.join()
+    finally:
+        # Detener trabajadores restantes antes de liberar la memoria
+        for process in processes:
+            if process.pid is None:
+                continue
+            if process.is_alive():
+                process.terminate()
+            process.join()
+        buffer.release()
+        shm.close()
+        shm.unlink()
+
+    workers.sort(key=lambda w: w["worker_id"])
+    winner = min(workers, key=lambda w: w["best_value"])
+
+    return {
+        "best": winner["best"],
+        "best_value": winner["best_value"],
+        "history": winner["history"],
+        "initial_point": winner["initial_point"],
+        "workers": workers
+    }
+
+
+if __name__ == "__main__":
+    resultados = parallel_tabu_search()
+    print("Mejor posición encontrada:", resultados["best"])
+    print("Valor mínimo:", resultados["best_value"])
+    for w in resultados["workers"]:
+        print(f"Proceso {w['worker_id']}: {w['best_value']} "
+              f"(reinicios: {w['restarts']})")
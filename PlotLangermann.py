@@ -4,50 +4,343 @@ Module for plotting the Langermann function and the results of the Tabu search a
 This module provides functions to visualize the Langermann function in 2D and 3D,
 as well as the history of the Tabu search optimization process.
 
+Long histories are reduced to screen resolution with min/max envelope
+decimation, so plotting time does not depend on the number of iterations.
+
+Classes:
+    - LiveConvergencePlot: Incrementally updated convergence plot fed from a
+        live history stream, using constant memory.
+
 Methods:
+    - decimate_minmax(history, num_bins): Reduces a history to per-bin 
+        minimum and maximum envelopes.
     - plot_history(history): Plots the evolution of the minimum value 
         over iterations.
+    - plot_convergence(histories): Plots one run as a min/max envelope or 
+        many runs as percentile bands.
+    - langermann_grid(resolution): Evaluates (once, cached) the Langermann 
+        function on the plotting grid.
     - plot_heatmap(best_pos): Generates a 2D heatmap of the Langermann 
         function with the best position marked.
     - plot_surface(best_pos): Generates a 3D surface plot of the Langermann 
         function with the best position marked.
 """
+from functools import lru_cache
 import numpy as np  
 import matplotlib.pyplot as plt  
 from mpl_toolkits.mplot3d import Axes3D  
 import TabuLangermann as tl
 
 
-def plot_history(history):
+# Número de puntos por curva, del orden de la resolución horizontal
+SCREEN_BINS = 2000
+
+
+def _close_bins(starts, end, *series):
+    """
+    Agrega el borde final a los inicios de intervalo y repite el último
+    valor de cada serie, para que los escalones (`step="post"`) cubran
+    también el último intervalo.
+
+    Args:
+        starts (np.ndarray): Iteración inicial de cada intervalo.
+        end (int): Iteración final (exclusiva) del último intervalo.
+        *series (np.ndarray): Valores por intervalo.
+
+    Returns:
+        tuple[np.ndarray, ...]: Bordes y series extendidas.
+    """
+    if len(starts) == 0:
+        return (starts,) + series
+    return (np.append(starts, end),) + tuple(
+        np.append(s, s[..., -1:], axis=-1) for s in series)
+
+
+def decimate_minmax(history, num_bins=SCREEN_BINS):
+    """
+    Reduce un historial a envolventes mínima y máxima por intervalo.
+
+    Args:
+        history (list[float]): Valores por iteración.
+        num_bins (int): Número máximo de intervalos resultantes.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]:
+            - Bordes de los intervalos: la iteración inicial de cada uno y,
+              al final, el número total de iteraciones.
+            - Valor mínimo de cada intervalo (el último, repetido).
+            - Valor máximo de cada intervalo (el último, repetido).
+    """
+    values = np.asarray(history, dtype=float)
+
+    # Sin reducción si el historial ya cabe en pantalla
+    if len(values) <= num_bins:
+        return _close_bins(np.arange(len(values)), len(values),
+                           values, values)
+
+    # Dividir en intervalos contiguos de tamaño casi uniforme
+    starts = np.linspace(0, len(values), num_bins, endpoint=False)
+    starts = np.unique(starts.astype(int))
+    lower = np.minimum.reduceat(values, starts)
+    upper = np.maximum.reduceat(values, starts)
+
+    return _close_bins(starts, len(values), lower, upper)
+
+
+def plot_history(history, num_bins=SCREEN_BINS, show=True):
     """
     Grafica la evolución del valor mínimo en cada iteración.
 
+    Los historiales más largos que `num_bins` se dibujan como envolvente
+    mínima/máxima por intervalo.
+
     Args:
         history (list[float]): Valores mínimos por iteración.
+        num_bins (int): Número máximo de puntos a dibujar.
+        show (bool): Si es True, muestra la figura (bloqueante).
     """
+    x, lower, upper = decimate_minmax(history, num_bins)
+
     # Crear la figura y el eje
     plt.figure()
-    plt.plot(history, label="Valor mínimo")
+    if len(x) - 1 < len(history):
+        plt.fill_between(x, lower, upper, step="post", alpha=0.4)
+    plt.step(x, lower, where="post", label="Valor mínimo")
     plt.title("Evolución de la búsqueda tabú")
     plt.xlabel("Iteración")
     plt.ylabel("Valor de la función")
     plt.grid(True)
     plt.legend()
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
 
 
-def plot_heatmap(best_pos):
+def plot_convergence(histories, num_bins=SCREEN_BINS,
+                     percentiles=(5, 25, 50, 75, 95), show=True):
     """
-    Genera un mapa de calor 2D de la función Langermann
-    y marca la mejor posición encontrada.
+    Grafica la convergencia de una o varias corridas.
+
+    Una sola corrida se dibuja como envolvente mínima/máxima. Varias
+    corridas se reducen a una malla común de intervalos (tomando el mínimo
+    de cada intervalo) y se dibujan como bandas de percentiles.
 
     Args:
-        best_pos (list[float]): Coordenadas [x, y] de la mejor solución.
+        histories (list[float] | list[list[float]]): Historial de una
+            corrida o lista de historiales.
+        num_bins (int): Número máximo de intervalos a dibujar.
+        percentiles (tuple[float, ...]): Percentiles de las bandas, en
+            pares simétricos alrededor de la mediana.
+        show (bool): Si es True, muestra la figura (bloqueante).
+    """
+    plt.figure()
+
+    if np.ndim(histories[0]) == 0:
+        # Una sola corrida: envolvente mínima/máxima
+        x, lower, upper = decimate_minmax(histories, num_bins)
+        plt.fill_between(x, lower, upper, step="post", alpha=0.4,
+                         label="Envolvente mín/máx")
+        plt.step(x, lower, where="post", label="Valor mínimo")
+    else:
+        # Malla común de intervalos sobre la corrida más larga
+        length = max(len(h) for h in histories)
+        bins = min(num_bins, length)
+        starts = np.unique(
+            np.linspace(0, length, bins, endpoint=False).astype(int))
+
+        # Mínimo de cada corrida por intervalo; las corridas más cortas
+        # conservan su último valor
+        reduced = np.empty((len(histories), len(starts)))
+        for i, history in enumerate(histories):
+            values = np.asarray(history, dtype=float)
+            padded = np.full(length, values[-1])
+            padded[:len(values)] = values
+            reduced[i] = np.minimum.reduceat(padded, starts)
+
+        # Bandas simétricas de percentiles alrededor de la mediana,
+        # cerradas en la última iteración
+        bands = np.percentile(reduced, percentiles, axis=0)
+        edges, bands = _close_bins(starts, length, bands)
+        half = len(percentiles) // 2
+        for k in range(half):
+            plt.fill_between(edges, bands[k], bands[-1 - k], step="post",
+                             alpha=0.25,
+                             label=f"P{percentiles[k]:g}–"
+                                   f"P{percentiles[-1 - k]:g}")
+        if len(percentiles) % 2:
+            plt.step(edges, bands[half], where="post",
+                     label=f"P{percentiles[half]:g}")
+
+    plt.title("Convergencia de la búsqueda tabú")
+    plt.xlabel("Iteración")
+    plt.ylabel("Valor de la función")
+    plt.grid(True)
+    plt.legend()
+    plt.tight_layout()
+    if show:
+        plt.show()
+
+
+class LiveConvergencePlot:
+    """
+    Gráfica de convergencia que se actualiza a partir de un flujo de valores.
+
+    Los valores se acumulan en a lo sumo `num_bins` intervalos con su mínimo
+    y máximo. Cuando se llenan, los intervalos se fusionan por pares y su
+    ancho se duplica, de modo que la memoria y el costo de cada redibujado
+    son constantes sin importar la longitud de la corrida.
+
+    Puede pasarse directamente como `callback` a `tabu_search` o a
+    `gradient_descent`. Al terminar la corrida debe llamarse a `finish()`
+    para dibujar los valores recibidos desde el último redibujado.
+
+    Attributes:
+        num_bins (int): Número máximo de intervalos (par).
+        refresh_every (int): Cada cuántos valores redibujar.
+        count (int): Número de valores recibidos.
+    """
+
+    def __init__(self, num_bins=SCREEN_BINS, refresh_every=100):
+        """
+        Crea la figura vacía.
+
+        Args:
+            num_bins (int): Número máximo de intervalos (se redondea a par).
+            refresh_every (int): Cada cuántos valores redibujar.
+        """
+        self.num_bins = num_bins + num_bins % 2
+        self.refresh_every = refresh_every
+        self.count = 0
+
+        # Envolventes por intervalo y ancho actual de cada intervalo
+        self._lower = np.empty(self.num_bins)
+        self._upper = np.empty(self.num_bins)
+        self._filled = 0
+        self._width = 1
+
+        # Crear la figura en modo interactivo para que se muestre sin
+        # bloquear, restaurando después el modo previo del proceso
+        interactive = plt.isinteractive()
+        plt.ion()
+        try:
+            self.fig, self.ax = plt.subplots()
+        finally:
+            if not interactive:
+                plt.ioff()
+
+        # Crear los artistas que se actualizarán
+        self._line, = self.ax.plot([], [], drawstyle="steps-post",
+                                   label="Valor mínimo")
+        self._band = None
+        self.ax.set_title("Evolución de la búsqueda tabú")
+        self.ax.set_xlabel("Iteración")
+        self.ax.set_ylabel("Valor de la función")
+        self.ax.grid(True)
+        self.ax.legend()
+
+    def __call__(self, iteration, value):
+        """
+        Recibe un valor en formato de `callback` (iteración, valor).
+        """
+        self.push(value)
+
+    def push(self, value):
+        """
+        Agrega un valor y redibuja cada `refresh_every` valores.
+
+        Args:
+            value (float): Nuevo valor del historial.
+        """
+        self._append(value)
+        if self.count % self.refresh_every == 0:
+            self.refresh()
+
+    def extend(self, values):
+        """
+        Agrega varios valores y redibuja una sola vez.
+
+        Args:
+            values (list[float]): Nuevos valores del historial.
+        """
+        for value in values:
+            self._append(value)
+        self.refresh()
+
+    def finish(self):
+        """
+        Redibuja con todos los valores recibidos; se llama al terminar la
+        corrida, ya que `push` solo redibuja cada `refresh_every` valores.
+        """
+        self.refresh()
+
+    def _append(self, value):
+        """
+        Acumula un valor en el intervalo actual sin redibujar.
+        """
+        if self.count % self._width == 0:
+            # Abrir un nuevo intervalo, compactando si no hay espacio
+            if self._filled == self.num_bins:
+                self._compact()
+            self._lower[self._filled] = value
+            self._upper[self._filled] = value
+            self._filled += 1
+        else:
+            last = self._filled - 1
+            self._lower[last] = min(self._lower[last], value)
+            self._upper[last] = max(self._upper[last], value)
+
+        self.count += 1
+
+    def refresh(self):
+        """
+        Actualiza los artistas con las envolventes actuales.
+        """
+        # Bordes de los intervalos; el último termina en el valor más reciente
+        n = self._filled
+        x, lower, upper = _close_bins(np.arange(n) * self._width, self.count,
+                                      self._lower[:n], self._upper[:n])
+
+        # Actualizar la línea y reemplazar solo la banda
+        self._line.set_data(x, lower)
+        if self._band is not None:
+            self._band.remove()
+        self._band = self.ax.fill_between(x, lower, upper, step="post",
+                                          alpha=0.4,
+                                          color=self._line.get_color())
+
+        self.ax.relim()
+        self.ax.autoscale_view()
+        self.fig.canvas.draw_idle()
+        self.fig.canvas.flush_events()
+
+    def _compact(self):
+        """
+        Fusiona los intervalos por pares y duplica su ancho.
+        """
+        half = self.num_bins // 2
+        self._lower[:half] = np.minimum(self._lower[0::2], self._lower[1::2])
+        self._upper[:half] = np.maximum(self._upper[0::2], self._upper[1::2])
+        self._filled = half
+        self._width *= 2
+
+
+@lru_cache(maxsize=None)
+def langermann_grid(resolution=200):
+    """
+    Evalúa la función Langermann sobre una malla del rango [0, 10].
+
+    El resultado se guarda en caché para que el mapa de calor y la
+    superficie no repitan la evaluación.
+
+    Args:
+        resolution (int): Número de puntos por eje.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Mallas X, Y y Z.
     """
     # Crear una malla de puntos en el rango [0, 10]
-    x = np.linspace(0, 10, 200)
-    y = np.linspace(0, 10, 200)
+    x = np.linspace(0, 10, resolution)
+    y = np.linspace(0, 10, resolution)
     X, Y = np.meshgrid(x, y)
 
     # Evaluar la función en cada punto de la malla
@@ -56,6 +349,21 @@ def plot_heatmap(best_pos):
         for j in range(X.shape[1]):
             Z[i, j] = tl.evaluate_langermann([X[i, j], Y[i, j]])
 
+    return X, Y, Z
+
+
+def plot_heatmap(best_pos, show=True):
+    """
+    Genera un mapa de calor 2D de la función Langermann
+    y marca la mejor posición encontrada.
+
+    Args:
+        best_pos (list[float]): Coordenadas [x, y] de la mejor solución.
+        show (bool): Si es True, muestra la figura (bloqueante).
+    """
+    # Obtener la malla evaluada (se calcula una sola vez)
+    X, Y, Z = langermann_grid()
+
     # Crear la figura y el mapa de calor
     plt.figure(figsize=(8, 6))
     heatmap = plt.contourf(X, Y, Z, levels=100, cmap='viridis')
@@ -68,27 +376,21 @@ def plot_heatmap(best_pos):
     plt.legend()
     plt.grid(True)
     plt.tight_layout()
-    plt.show()
+    if show:
+        plt.show()
 
 
-def plot_surface(best_pos):
+def plot_surface(best_pos, show=True):
     """
     Genera una gráfica 3D de la superficie de la función Langermann
     y marca la mejor posición encontrada.
 
     Args:
         best_pos (list[float]): Coordenadas [x, y] de la mejor solución.
+        show (bool): Si es True, muestra la figura (bloqueante).
     """
-    # Crear una malla de puntos en el rango [0, 10]
-    x = np.linspace(0, 10, 200)
-    y = np.linspace(0, 10, 200)
-    X, Y = np.meshgrid(x, y)
-
-    # Evaluar la función en cada punto de la malla
-    Z = np.zeros_like(X)
-    for i in range(X.shape[0]):
-        for j in range(X.shape[1]):
-            Z[i, j] = tl.evaluate_langermann([X[i, j], Y[i, j]])
+    # Obtener la malla evaluada (se calcula una sola vez)
+    X, Y, Z = langermann_grid()
 
     # Crear figura y ejes 3D
     fig = plt.figure(figsize=(10, 7))
@@ -109,4 +411,5 @@ def plot_surface(best_pos):
     ax.set_zlabel("f(x, y)")
     ax.legend()
     plt.tight_layout()
-    plt.show()
\ No newline at end of file
+    if show:
+        plt.show()
\ No newline at end of file
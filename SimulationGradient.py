@@ -1,7 +1,7 @@
-import numpy as np
 import itertools
 import TabuLangermann as tl
 import GradientDescent as gd
+import StreamingStats as ss
 
 
 
@@ -23,8 +23,8 @@ def simulate_parameters(func, start_point, learning_rate, tolerance,
     Returns:
         dict: Resultados estadísticos de las repeticiones.
     """
-    valores_finales = []
-    iteraciones = []
+    valores_finales = ss.RunningStats()
+    iteraciones = ss.RunningStats()
 
     for _ in range(num_reps):
         punto, valor, historial = gd.gradient_descent(
@@ -35,14 +35,14 @@ def simulate_parameters(func, start_point, learning_rate, tolerance,
             tolerance=tolerance,
             h=h
         )
-        valores_finales.append(valor)
-        iteraciones.append(len(historial))
+        valores_finales.update(valor)
+        iteraciones.update(len(historial))
 
     return {
         "params": (learning_rate, tolerance, h),
-        "media_valor": np.mean(valores_finales),
-        "std_valor": np.std(valores_finales),
-        "media_iters": np.mean(iteraciones)
+        "media_valor": valores_finales.mean,
+        "std_valor": valores_finales.std,
+        "media_iters": iteraciones.mean
     }
 
 
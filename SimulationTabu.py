@@ -1,6 +1,6 @@
-import numpy as np
 import itertools
 import TabuLangermann as tl
+import StreamingStats as ss
 
 
 def simular_busqueda_tabu(func, start_bounds, num_iterations, num_neighbors,
@@ -18,22 +18,20 @@ def simular_busqueda_tabu(func, start_bounds, num_iterations, num_neighbors,
     Returns:
         dict: Resultados estadísticos de las repeticiones.
     """
-    valores_finales = []
+    # Generador de repeticiones de Búsqueda Tabú
+    corridas = (tl.tabu_search(num_iterations=num_iterations,
+                               num_neighbors=num_neighbors,
+                               tabu_size=tabu_size,
+                               sigma=sigma)
+                for _ in range(num_reps))
 
-    for _ in range(num_reps):
-        # Inicializar Búsqueda Tabú
-        results = tl.tabu_search(num_iterations=num_iterations,
-                                 num_neighbors=num_neighbors,
-                                 tabu_size=tabu_size,
-                                 sigma=sigma)
-
-        # Añadir a la lista de valores
-        valores_finales.append(results["best_value"])
+    # Agregar los valores finales en flujo
+    stats = ss.summarize(corridas, key="best_value")
 
     return {
         "params": (num_iterations, num_neighbors, tabu_size, sigma),
-        "media_valor": np.mean(valores_finales),
-        "std_valor": np.std(valores_finales)
+        "media_valor": stats.mean,
+        "std_valor": stats.std
     }
 
 
@@ -23,13 +23,13 @@ print("Mejor posición encontrada:", mejor_posicion)
 print("Valor mínimo:", mejor_valor)
 print("Punto inicial:", punto_inicial)
 
-# Mostrar evolución
-pl.plot_history(historial)
+# Mostrar evolución (sin bloquear; se muestra junto a las demás figuras)
+pl.plot_history(historial, show=False)
 
 # Mostrar mapa de calor
-pl.plot_heatmap(mejor_posicion)
+pl.plot_heatmap(mejor_posicion, show=False)
 
-# Mostrar superficie 3D
+# Mostrar superficie 3D y todas las figuras a la vez
 pl.plot_surface(mejor_posicion)
 
 # Imprimir el método del gradiente numérico
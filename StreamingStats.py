@@ -0,0 +1,310 @@
+"""
+Module for streaming, constant-memory statistics over repeated runs.
+
+This module aggregates the results of many optimization runs without storing
+them. Mean and variance are updated with Welford's algorithm, minimum and
+maximum are tracked directly and quantiles are estimated with a small
+merging centroid sketch (in the spirit of t-digest), which keeps more
+resolution near the tails. Aggregators are plain picklable objects and can
+be merged, so each worker process can summarize its own runs and the
+partial results can be combined afterwards.
+
+Classes:
+    - RunningStats: Streaming aggregator of mean, variance, min, max and
+        quantiles.
+
+Methods:
+    - summarize(runs, key, report_every, report): Consumes an iterable of
+        run results (e.g. a generator of `tabu_search` calls) and returns the
+        aggregated statistics, optionally reporting partial summaries.
+    - print_summary(stats): Prints a one-line partial summary.
+"""
+import math
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+
+
+class RunningStats:
+    """
+    Agregador en flujo de estadísticas de corridas repetidas.
+
+    Attributes:
+        count (int): Número de valores agregados.
+        mean (float): Media de los valores.
+        min (float): Valor mínimo observado.
+        max (float): Valor máximo observado.
+        compression (int): Parámetro de compresión del bosquejo de
+            cuantiles; a mayor valor, más centroides y más precisión.
+    """
+
+    def __init__(self, compression: int = 100) -> None:
+        """
+        Inicializa un agregador vacío.
+
+        Args:
+            compression (int): Parámetro de compresión del bosquejo de
+                cuantiles. Por defecto 100.
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        self.compression = compression
+
+        # Suma de cuadrados de las diferencias respecto a la media (Welford)
+        self._m2 = 0.0
+
+        # Centroides (media, peso) ordenados y valores aún sin comprimir
+        self._centroids: List[Tuple[float, float]] = []
+        self._buffer: List[float] = []
+
+    def update(self, value: float) -> None:
+        """
+        Agrega un valor al resumen.
+
+        Args:
+            value (float): Valor a agregar.
+        """
+        # Actualizar media y varianza con el algoritmo de Welford
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self._m2 += delta * (value - self.mean)
+
+        # Actualizar extremos
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+        # Acumular en el búfer y comprimir cuando se llene
+        self._buffer.append(value)
+        if len(self._buffer) >= 5 * self.compression:
+            self._compress()
+
+    def merge(self, other: "RunningStats") -> "RunningStats":
+        """
+        Combina otro agregador en este (por ejemplo, el de otro proceso).
+
+        Args:
+            other (RunningStats): Agregador a combinar.
+
+        Returns:
+            RunningStats: Este mismo agregador, ya combinado.
+        """
+        if other.count == 0:
+            return self
+
+        # Combinar media y varianza con la fórmula de Chan et al.
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self._m2 += other._m2 + delta**2 * self.count * other.count / total
+        self.mean += delta * other.count / total
+        self.count = total
+
+        # Combinar extremos y bosquejos de cuantiles
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        self._centroids.extend(other._centroids)
+        self._buffer.extend(other._buffer)
+        self._compress()
+
+        return self
+
+    @property
+    def variance(self) -> float:
+        """
+        float: Varianza poblacional (equivalente a `np.var`).
+        """
+        return self._m2 / self.count if self.count else math.nan
+
+    @property
+    def sample_variance(self) -> float:
+        """
+        float: Varianza muestral (con corrección de Bessel).
+        """
+        return self._m2 / (self.count - 1) if self.count > 1 else math.nan
+
+    @property
+    def std(self) -> float:
+        """
+        float: Desviación estándar poblacional (equivalente a `np.std`).
+        """
+        return math.sqrt(self.variance)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estima un cuantil a partir del bosquejo de centroides.
+
+        Args:
+            q (float): Cuantil deseado en [0, 1].
+
+        Returns:
+            float: Valor estimado del cuantil.
+        """
+        if self.count == 0:
+            return math.nan
+        if not 0 <= q <= 1:
+            raise ValueError("El cuantil debe estar en [0, 1].")
+
+        self._compress()
+        if q == 0:
+            return self.min
+        if q == 1:
+            return self.max
+
+        # Posición objetivo en peso acumulado
+        target = q * self.count
+
+        # Interpolar entre los centros de los centroides, usando los
+        # extremos observados como límites
+        prev_pos, prev_mean = 0.0, self.min
+        cumulative = 0.0
+        for mean, weight in self._centroids:
+            pos = cumulative + weight / 2
+            if target <= pos:
+                if pos == prev_pos:
+                    return mean
+                frac = (target - prev_pos) / (pos - prev_pos)
+                return prev_mean + frac * (mean - prev_mean)
+            prev_pos, prev_mean = pos, mean
+            cumulative += weight
+
+        # Interpolar entre el último centroide y el máximo
+        if self.count == prev_pos:
+            return self.max
+        frac = (target - prev_pos) / (self.count - prev_pos)
+        return prev_mean + frac * (self.max - prev_mean)
+
+    def summary(self,
+                quantiles: Iterable[float] = (0.05, 0.25, 0.5, 0.75, 0.95)
+                ) -> Dict[str, float]:
+        """
+        Construye un resumen de las estadísticas actuales.
+
+        Args:
+            quantiles (Iterable[float]): Cuantiles a incluir en el resumen.
+
+        Returns:
+            Dict[str, float]:
+                Diccionario con 'count', 'mean', 'std', 'min', 'max' y una
+                entrada 'q<percentil>' por cada cuantil solicitado.
+        """
+        result = {
+            "count": self.count,
+            "mean": self.mean if self.count else math.nan,
+            "std": self.std,
+            "min": self.min,
+            "max": self.max
+        }
+        for q in quantiles:
+            result[f"q{q * 100:g}"] = self.quantile(q)
+
+        return result
+
+    def _compress(self) -> None:
+        """
+        Fusiona el búfer con los centroides manteniendo su número acotado.
+
+        Los centroides cercanos a las colas admiten menos peso que los del
+        centro, lo que preserva la precisión de cuantiles extremos.
+        """
+        items = self._centroids + [(v, 1.0) for v in self._buffer]
+        self._buffer = []
+        if not items:
+            return
+
+        items.sort(key=lambda c: c[0])
+        total = sum(w for _, w in items)
+
+        merged = []
+        cur_mean, cur_weight = items[0]
+        cumulative = 0.0
+        for mean, weight in items[1:]:
+            # Peso máximo permitido según la posición del centroide
+            q = (cumulative + cur_weight + weight / 2) / total
+            limit = 4 * total * q * (1 - q) / self.compression
+
+            if cur_weight + weight <= max(limit, 1.0):
+                cur_weight += weight
+                cur_mean += (mean - cur_mean) * weight / cur_weight
+            else:
+                merged.append((cur_mean, cur_weight))
+                cumulative += cur_weight
+                cur_mean, cur_weight = mean, weight
+        merged.append((cur_mean, cur_weight))
+
+        self._centroids = merged
+
+
+def _extract(run: Any, key: Union[str, int, Callable[[Any], float], None]
+             ) -> float:
+    """
+    Extrae el valor numérico de una corrida.
+
+    Args:
+        run (Any): Resultado de una corrida (diccionario, tupla o número).
+        key (Union[str, int, Callable[[Any], float], None]): Clave o índice
+            del valor, función que lo calcula o None si la corrida ya es el
+            valor.
+
+    Returns:
+        float: Valor numérico de la corrida.
+    """
+    if key is None:
+        return run
+    if callable(key):
+        return key(run)
+    return run[key]
+
+
+def summarize(runs: Iterable[Any],
+              key: Union[str, int, Callable[[Any], float], None] = "best_value",
+              report_every: int = 0,
+              report: Optional[Callable[[RunningStats], None]] = None,
+              stats: Optional[RunningStats] = None) -> RunningStats:
+    """
+    Consume un iterable de corridas y agrega sus valores en memoria constante.
+
+    Funciona con cualquiera de los ejecutores del proyecto: para
+    `tabu_search` se usa la clave 'best_value' (por defecto) y para
+    `gradient_descent`, que devuelve una tupla, el índice 1.
+
+    Args:
+        runs (Iterable[Any]): Corridas, idealmente un generador.
+        key (Union[str, int, Callable[[Any], float], None]): Cómo extraer el
+            valor de cada corrida. Por defecto 'best_value'.
+        report_every (int): Cada cuántas corridas invocar `report`. Si es 0
+            no se reportan resúmenes parciales.
+        report (Optional[Callable[[RunningStats], None]]): Función que
+            recibe el agregador parcial. Por defecto imprime un resumen.
+        stats (Optional[RunningStats]): Agregador a continuar. Por defecto
+            se crea uno nuevo.
+
+    Returns:
+        RunningStats: Agregador con las estadísticas de todas las corridas.
+    """
+    if stats is None:
+        stats = RunningStats()
+    if report is None:
+        report = print_summary
+
+    for run in runs:
+        stats.update(_extract(run, key))
+
+        # Reportar resumen parcial
+        if report_every and stats.count % report_every == 0:
+            report(stats)
+
+    return stats
+
+
+def print_summary(stats: RunningStats) -> None:
+    """
+    Imprime una línea con el resumen parcial de un agregador.
+
+    Args:
+        stats (RunningStats): Agregador a resumir.
+    """
+    s = stats.summary(quantiles=(0.5,))
+    print(f"[{s['count']} corridas] media: {s['mean']:.6f}, "
+          f"std: {s['std']:.4e}, min: {s['min']:.6f}, "
+          f"mediana: {s['q50']:.6f}, max: {s['max']:.6f}")
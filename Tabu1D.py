@@ -0,0 +1,279 @@
+"""
+Module for a vectorized Tabu search over one-dimensional objectives.
+
+This module generalizes the example in `BusquedaTabuEjemplo.py`. Every
+iteration evaluates the whole neighbor stencil with a single call to a
+NumPy-vectorized objective, so each candidate is evaluated exactly once, and
+the tabu list is kept as a sorted index, in a preallocated NumPy buffer,
+that is queried with a tolerance instead of exact float equality.
+
+The search runs a batch of independent starts in lockstep: passing an array
+as `x_inicial` advances every trajectory with the same array operations, so
+repeated-run studies cost roughly one NumPy pass per iteration instead of
+one interpreter loop per run. A single start pays the same per-iteration
+NumPy overhead and is not faster than a plain Python loop.
+
+Classes:
+    - TabuIndex: Sorted tabu memory for a batch of searches, with FIFO
+        eviction and tolerance-based membership queries.
+
+Methods:
+    - gramacy_lee(x): Evaluates the Gramacy & Lee (2012) function.
+    - generate_stencil(paso, ancho): Builds the neighbor offsets.
+    - tabu_search_1d(func, ...): Executes the Tabu search on a 1D objective,
+        from one start or from a batch of starts.
+"""
+import random
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+import numpy as np
+
+
+
+def gramacy_lee(x: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """
+    Evalúa la función de Gramacy & Lee (2012), escalar o vectorizada.
+
+    Args:
+        x (Union[float, np.ndarray]): Punto(s) donde se evalúa la función.
+
+    Returns:
+        Union[float, np.ndarray]: Valor(es) de la función.
+    """
+    return np.sin(10 * np.pi * x) / (2 * x) + (x - 1)**4
+
+
+def generate_stencil(paso: float = 0.05, ancho: int = 1) -> np.ndarray:
+    """
+    Construye los desplazamientos de los vecinos: ±paso, ±2·paso, ...,
+    ±ancho·paso.
+
+    Args:
+        paso (float): Tamaño del paso elemental.
+        ancho (int): Número de pasos a cada lado del punto actual.
+
+    Returns:
+        np.ndarray: Desplazamientos ordenados, sin incluir el cero.
+    """
+    pasos = np.arange(1, ancho + 1)
+    return paso * np.concatenate((-pasos[::-1], pasos))
+
+
+
+class TabuIndex:
+    """
+    Memoria tabú ordenada para un lote de búsquedas, con expulsión FIFO y
+    consultas con tolerancia.
+
+    Cada fila del lote tiene su propia lista tabú. Las listas se guardan en
+    un búfer circular (orden de llegada) y en un búfer ordenado, ambos
+    preasignados. El búfer ordenado desplaza cada fila a un rango propio,
+    de modo que un único `np.searchsorted` resuelve las consultas de todas
+    las filas a la vez. Los puntos deben estar dentro de `limites`.
+
+    Attributes:
+        capacidad (int): Número máximo de soluciones tabú por fila.
+        tolerancia (float): Distancia bajo la cual un punto se considera
+            tabú.
+        num_filas (int): Número de búsquedas del lote.
+    """
+
+    def __init__(self,
+                 capacidad: int,
+                 tolerancia: float = 1e-6,
+                 limites: Tuple[float, float] = (0.0, 1.0),
+                 num_filas: int = 1) -> None:
+        """
+        Inicializa una memoria tabú vacía.
+
+        Args:
+            capacidad (int): Número máximo de soluciones tabú por fila.
+            tolerancia (float): Distancia bajo la cual un punto es tabú.
+            limites (Tuple[float, float]): Dominio [a, b] de los puntos.
+            num_filas (int): Número de búsquedas del lote.
+        """
+        self.capacidad = capacidad
+        self.tolerancia = tolerancia
+        self.num_filas = num_filas
+
+        # Las posiciones vacías usan un valor fuera del dominio; cada fila se
+        # desplaza a un rango [fila * ancho, (fila + 1) * ancho) sin solapes
+        a, b = limites
+        self._base = a
+        vacio = b + 2 * tolerancia + 1
+        ancho = (b - a) + 4 * tolerancia + 2
+        self._desplazamientos = (np.arange(num_filas) * ancho)[:, None]
+
+        self._circular = np.full((num_filas, capacidad), vacio)
+        self._ordenados = np.empty(num_filas * capacidad)
+        self._siguiente = 0
+        self._tamano = 0
+        self._reindexar()
+
+    def __len__(self) -> int:
+        return self._tamano
+
+    def add(self, xs: Union[float, np.ndarray]) -> None:
+        """
+        Agrega un punto por fila, expulsando el más antiguo de cada fila si
+        se excede la capacidad.
+
+        Args:
+            xs (Union[float, np.ndarray]): Punto de cada fila (o un escalar
+                si el lote tiene una sola fila).
+        """
+        if self.capacidad == 0:
+            return
+
+        self._circular[:, self._siguiente] = xs
+        self._siguiente = (self._siguiente + 1) % self.capacidad
+        self._tamano = min(self._tamano + 1, self.capacidad)
+        self._reindexar()
+
+    def contains(self, xs: np.ndarray) -> np.ndarray:
+        """
+        Verifica, de forma vectorizada, qué puntos son tabú en su fila.
+
+        Args:
+            xs (np.ndarray): Puntos candidatos, con forma (num_filas, k), o
+                (k,) si el lote tiene una sola fila.
+
+        Returns:
+            np.ndarray: Máscara booleana con la forma de `xs`, True donde el
+                punto es tabú.
+        """
+        xs = np.asarray(xs, dtype=float)
+        if self._tamano == 0:
+            return np.zeros(xs.shape, dtype=bool)
+
+        # Llevar cada consulta al rango de su fila
+        consultas = (xs.reshape(self.num_filas, -1) - self._base
+                     + self._desplazamientos).ravel()
+
+        # Comparar cada punto con sus vecinos inmediatos en el índice
+        ultimo = len(self._ordenados) - 1
+        pos = np.searchsorted(self._ordenados, consultas)
+        izquierda = self._ordenados[np.maximum(pos - 1, 0)]
+        derecha = self._ordenados[np.minimum(pos, ultimo)]
+
+        tabu = ((np.abs(consultas - izquierda) < self.tolerancia)
+                | (np.abs(derecha - consultas) < self.tolerancia))
+        return tabu.reshape(xs.shape)
+
+    def _reindexar(self) -> None:
+        """
+        Reconstruye en su lugar el búfer ordenado a partir del circular.
+        """
+        ordenados = self._ordenados.reshape(self._circular.shape)
+        ordenados[:] = self._circular
+        ordenados.sort(axis=1)
+        ordenados -= self._base
+        ordenados += self._desplazamientos
+
+
+def tabu_search_1d(func: Callable[[np.ndarray], np.ndarray] = gramacy_lee,
+                   limites: Tuple[float, float] = (0.5, 2.5),
+                   paso: float = 0.05,
+                   ancho: int = 1,
+                   max_iter: int = 100,
+                   tam_tabu: int = 10,
+                   tolerancia: float = 1e-6,
+                   x_inicial: Optional[Union[float, np.ndarray]] = None
+                   ) -> Dict[str, Any]:
+    """
+    Ejecuta Búsqueda Tabú sobre una función objetivo 1D vectorizada.
+
+    Si `x_inicial` es un arreglo, cada elemento inicia una búsqueda
+    independiente y todas avanzan a la vez. Una búsqueda sin vecinos
+    válidos se detiene y conserva su posición; el bucle termina cuando
+    todas se han detenido.
+
+    Args:
+        func (Callable[[np.ndarray], np.ndarray]): Función objetivo que
+            acepta un arreglo de puntos y devuelve sus valores.
+        limites (Tuple[float, float]): Dominio [a, b] de búsqueda.
+        paso (float): Tamaño del paso elemental entre vecinos.
+        ancho (int): Número de pasos a cada lado del punto actual. Con 1 se
+            obtiene el esquema ±paso del ejemplo original.
+        max_iter (int): Número máximo de iteraciones.
+        tam_tabu (int): Tamaño máximo de la lista tabú.
+        tolerancia (float): Distancia bajo la cual un punto es tabú.
+        x_inicial (Optional[Union[float, np.ndarray]]): Punto inicial o
+            arreglo de puntos iniciales. Si es None se elige un punto
+            aleatorio dentro del dominio.
+
+    Returns:
+        Dict[str, Any]:
+            Diccionario con:
+            - 'best': Mejor solución x encontrada.
+            - 'best_value': Valor mínimo encontrado.
+            - 'history': Lista de valores mínimos por iteración.
+            - 'initial_point': Punto inicial de la búsqueda.
+            - 'path': Puntos visitados, en orden.
+            - 'path_values': Valores de la función en los puntos visitados.
+            Con un lote de inicios, 'best', 'best_value' e 'initial_point'
+            son arreglos de forma (n,) y 'history', 'path' y 'path_values'
+            arreglos de forma (iteraciones + 1, n).
+    """
+    # Inicializar soluciones y desplazamientos de vecinos
+    if x_inicial is None:
+        x_inicial = random.uniform(*limites)
+    escalar = np.ndim(x_inicial) == 0
+    x_actual = np.array(x_inicial, dtype=float, ndmin=1)
+    filas = np.arange(len(x_actual))
+    desplazamientos = generate_stencil(paso, ancho)
+
+    valor_actual = np.asarray(func(x_actual), dtype=float)
+    mejor_x = x_actual.copy()
+    mejor_valor = valor_actual.copy()
+    activos = np.ones(len(x_actual), dtype=bool)
+
+    tabu = TabuIndex(tam_tabu, tolerancia, limites, len(x_actual))
+    history = [mejor_valor]
+    path = [x_actual]
+    path_values = [valor_actual]
+
+    for _ in range(max_iter):
+        # Generar y evaluar todos los vecinos de todas las búsquedas en una
+        # sola llamada
+        vecinos = np.clip(x_actual[:, None] + desplazamientos, *limites)
+        valores = func(vecinos)
+
+        # Criterio de aspiración: un tabú es válido si mejora el global
+        validos = ~tabu.contains(vecinos) | (valores < mejor_valor[:, None])
+        activos &= validos.any(axis=1)
+        if not activos.any():
+            break
+
+        # Elegir el mejor vecino válido de cada búsqueda activa
+        i = np.argmin(np.where(validos, valores, np.inf), axis=1)
+        x_actual = np.where(activos, vecinos[filas, i], x_actual)
+        valor_actual = np.where(activos, valores[filas, i], valor_actual)
+
+        mejora = valor_actual < mejor_valor
+        mejor_x = np.where(mejora, x_actual, mejor_x)
+        mejor_valor = np.where(mejora, valor_actual, mejor_valor)
+
+        tabu.add(x_actual)
+        history.append(mejor_valor)
+        path.append(x_actual)
+        path_values.append(valor_actual)
+
+    if escalar:
+        return {
+            "best": float(mejor_x[0]),
+            "best_value": float(mejor_valor[0]),
+            "history": [float(v[0]) for v in history],
+            "initial_point": float(path[0][0]),
+            "path": [float(x[0]) for x in path],
+            "path_values": [float(v[0]) for v in path_values]
+        }
+
+    return {
+        "best": mejor_x,
+        "best_value": mejor_valor,
+        "history": np.array(history),
+        "initial_point": path[0],
+        "path": np.array(path),
+        "path_values": np.array(path_values)
+    }
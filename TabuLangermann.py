@@ -16,7 +16,7 @@ Methods:
 """
 import math  
 import random
-from typing import Dict, List, Union
+from typing import Any, Callable, Dict, List, Optional
 
 
 
@@ -138,8 +138,11 @@ def is_tabu(position: List[float],
 def tabu_search(num_iterations: int = 1000, 
                 num_neighbors: int = 50, 
                 tabu_size: int = 30, 
-                sigma: float = 0.8
-                ) -> Dict[str, Union[List[float], float]]:
+                sigma: float = 0.8,
+                start_point: Optional[List[float]] = None,
+                initial_tabu: Optional[List[List[float]]] = None,
+                callback: Optional[Callable[[int, float], None]] = None
+                ) -> Dict[str, Any]:
     """
     Ejecuta el algoritmo de Búsqueda Tabú para optimizar Langermann 2D.
 
@@ -148,17 +151,28 @@ def tabu_search(num_iterations: int = 1000,
         num_neighbors (int): Cantidad de vecinos generados por iteración.
         tabu_size (int): Tamaño máximo de la lista tabú.
         sigma (float): Desviación estándar del ruido gaussiano para vecinos.
+        start_point (Optional[List[float]]): Punto inicial [x, y]. Si es 
+            None se elige uno aleatorio dentro del dominio.
+        initial_tabu (Optional[List[List[float]]]): Soluciones con las que 
+            se precarga la lista tabú (p. ej. compartidas por otro proceso).
+        callback (Optional[Callable[[int, float], None]]): Función que se 
+            invoca en cada iteración con el índice y el mejor valor actual.
 
     Returns:
-        Dict[str, Union[List[float], float]]:
+        Dict[str, Any]:
             Diccionario con:
             - 'best': Mejor solución [x, y] encontrada.
             - 'best_value': Valor mínimo encontrado.
             - 'history': Lista de valores mínimos por iteración.
             - 'initial_point': Punto inicial desde donde comenzó la búsqueda.
+            - 'last_point': Solución actual al terminar la búsqueda.
+            - 'tabu_list': Lista tabú al terminar la búsqueda.
     """
-    # Inicializar solución aleatoria dentro del dominio
-    current = [random.uniform(0, 10), random.uniform(0, 10)]
+    # Inicializar solución (aleatoria si no se indica) dentro del dominio
+    if start_point is None:
+        current = [random.uniform(0, 10), random.uniform(0, 10)]
+    else:
+        current = list(start_point)
 
     # Guardar el valor de la posición inicial
     initial_point = current
@@ -170,12 +184,13 @@ def tabu_search(num_iterations: int = 1000,
     best = current
     best_value = current_value
 
-    # Inicializar lista tabú e historial
-    tabu_list = [current]
+    # Inicializar lista tabú (con entradas previas, si las hay) e historial
+    tabu_list = [list(p) for p in (initial_tabu or [])]
+    tabu_list = tabu_list[max(0, len(tabu_list) - tabu_size + 1):] + [current]
     history = [best_value]
 
     # Bucle principal de iteraciones
-    for _ in range(num_iterations):
+    for iteration in range(num_iterations):
         # Generar vecinos con perturbaciones gaussianas
         neighbors = generate_neighbors(current, num_neighbors, sigma)
 
@@ -218,12 +233,18 @@ def tabu_search(num_iterations: int = 1000,
         # Registrar valor mínimo actual en el historial
         history.append(best_value)
 
+        # Notificar progreso
+        if callback is not None:
+            callback(iteration, best_value)
+
     # Construir resultado en diccionario
     result = {
         "best": best,
         "best_value": best_value,
         "history": history,
-        "initial_point": initial_point
+        "initial_point": initial_point,
+        "last_point": current,
+        "tabu_list": tabu_list
     }
 
 
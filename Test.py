@@ -1,16 +1,15 @@
 import TabuLangermann as tl
-import numpy as np
+import StreamingStats as ss
 
 
 
-values = []
+# Generador de corridas: no se guarda ningún resultado en memoria
+runs = (tl.tabu_search() for _ in range(1000))
 
-for i in range(1000):
-    results = tl.tabu_search()
-    values.append(results["best_value"])
-    print(f"Run {i+1}: {results['best_value']}")
+# Agregar en flujo, mostrando un resumen parcial cada 100 corridas
+stats = ss.summarize(runs, key="best_value", report_every=100)
 
-print(f"Mean: {sum(values)/len(values)}")
-print(f"Std: {np.std(values)}")
-print(f"Min: {min(values)}")
-print(f"Max: {max(values)}")
\ No newline at end of file
+print(f"Mean: {stats.mean}")
+print(f"Std: {stats.std}")
+print(f"Min: {stats.min}")
+print(f"Max: {stats.max}")
\ No newline at end of file